@@ -8,11 +8,14 @@ type ModelInfo struct {
 	Description  string `json:"description"`
 	Url          string `json:"url"`
 	FileName     string `json:"fileName"`
+	Sha1         string `json:"sha1,omitempty"` // Published SHA-1 of the file, if known
 	IsDownloaded bool   `json:"isDownloaded"`
 	IsActive     bool   `json:"isActive"`
 }
 
-// GetSupportedModels returns the list of all supported Whisper models
+// GetSupportedModels returns the list of all supported Whisper models.
+// Checksums come from the model table in whisper.cpp/models/README.md;
+// models not listed there are downloaded without verification.
 func GetSupportedModels() []ModelInfo {
 	return []ModelInfo{
 		// Tiny models
@@ -23,6 +26,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "Fastest model with basic accuracy. Good for real-time applications.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-tiny.bin",
 			FileName:    "ggml-tiny.bin",
+			Sha1:        "bd577a113a864445d4c299885e0cb97d4ba92b5f",
 		},
 		{
 			Name:        "tiny.en",
@@ -31,6 +35,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "English-only tiny model. Fastest and most optimized for English speech.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-tiny.en.bin",
 			FileName:    "ggml-tiny.en.bin",
+			Sha1:        "c78c86eb1a8faa21b369bcd33207cc90d64ae9df",
 		},
 		{
 			Name:        "tiny-q5_1",
@@ -65,6 +70,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "Balanced speed and accuracy. Good default for most applications.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-base.bin",
 			FileName:    "ggml-base.bin",
+			Sha1:        "465707469ff3a37a2b9b8d8f89f2f99de7299dac",
 		},
 		{
 			Name:        "base.en",
@@ -73,6 +79,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "English-only base model. Good balance of speed and accuracy for English.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-base.en.bin",
 			FileName:    "ggml-base.en.bin",
+			Sha1:        "137c40403d78fd54d454da0f9bd998f78703390c",
 		},
 		{
 			Name:        "base-q5_1",
@@ -107,6 +114,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "High accuracy multilingual model. Good for most production use cases.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-small.bin",
 			FileName:    "ggml-small.bin",
+			Sha1:        "55356645c2b361a969dfd0ef2c5a50d530afd8d5",
 		},
 		{
 			Name:        "small.en",
@@ -115,6 +123,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "English-only small model. Excellent accuracy for English speech.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-small.en.bin",
 			FileName:    "ggml-small.en.bin",
+			Sha1:        "db8a495a91d927739e50b3fc1cc4c6b8f6c2d022",
 		},
 		{
 			Name:        "small.en-tdrz",
@@ -123,6 +132,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "Small English model with speaker diarization support.",
 			Url:         "https://huggingface.co/akashmjn/tinydiarize-whisper.cpp/resolve/main/ggml-small.en-tdrz.bin",
 			FileName:    "ggml-small.en-tdrz.bin",
+			Sha1:        "b6c6e7e89af1a35c08e6de56b66ca6a02a2fdfa1",
 		},
 		{
 			Name:        "small-q5_1",
@@ -157,6 +167,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "Very high accuracy multilingual model. Best for critical applications.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-medium.bin",
 			FileName:    "ggml-medium.bin",
+			Sha1:        "fd9727b6e1217c2f614f9b698455c4ffd82463b4",
 		},
 		{
 			Name:        "medium.en",
@@ -165,6 +176,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "English-only medium model. Exceptional accuracy for English speech.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-medium.en.bin",
 			FileName:    "ggml-medium.en.bin",
+			Sha1:        "8c30f0e44ce9560643ebd10bbe50cd20eafd3723",
 		},
 		{
 			Name:        "medium-q5_0",
@@ -199,6 +211,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "Original large model. Highest accuracy for multilingual speech.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-large-v1.bin",
 			FileName:    "ggml-large-v1.bin",
+			Sha1:        "b1caaf735c4cc1429223d5a74f0f4d0b9b59a299",
 		},
 		{
 			Name:        "large-v2",
@@ -207,6 +220,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "Improved large model with better accuracy across languages.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-large-v2.bin",
 			FileName:    "ggml-large-v2.bin",
+			Sha1:        "0f4c8e34f21cf1a914c59d8b3ce882345ad349d6",
 		},
 		{
 			Name:        "large-v2-q5_0",
@@ -215,6 +229,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "Quantized large v2 model. High accuracy with manageable size.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-large-v2-q5_0.bin",
 			FileName:    "ggml-large-v2-q5_0.bin",
+			Sha1:        "00e39f2196344e901b3a2bd5814807a769bd1630",
 		},
 		{
 			Name:        "large-v2-q8_0",
@@ -231,6 +246,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "Latest large model. State-of-the-art accuracy across all languages.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-large-v3.bin",
 			FileName:    "ggml-large-v3.bin",
+			Sha1:        "ad82bf6a9043ceed055076d0fd39f5f186ff8062",
 		},
 		{
 			Name:        "large-v3-q5_0",
@@ -239,6 +255,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "Quantized large v3 model. Best accuracy with reasonable size.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-large-v3-q5_0.bin",
 			FileName:    "ggml-large-v3-q5_0.bin",
+			Sha1:        "e6e2ed78495d403bef4b7cff42ef4aaadcfea8de",
 		},
 		{
 			Name:        "large-v3-turbo",
@@ -247,6 +264,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "Optimized large v3 model. Faster inference with minimal accuracy loss.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-large-v3-turbo.bin",
 			FileName:    "ggml-large-v3-turbo.bin",
+			Sha1:        "4af2b29d7ec73d781377bfd1758ca957a807e941",
 		},
 		{
 			Name:        "large-v3-turbo-q5_0",
@@ -255,6 +273,7 @@ func GetSupportedModels() []ModelInfo {
 			Description: "Quantized turbo model. Fast and accurate with small footprint.",
 			Url:         "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/ggml-large-v3-turbo-q5_0.bin",
 			FileName:    "ggml-large-v3-turbo-q5_0.bin",
+			Sha1:        "e050f7970618a659205450ad97eb95a18d69c9ee",
 		},
 		{
 			Name:        "large-v3-turbo-q8_0",
@@ -116,6 +116,10 @@ func NewTranscriptionService() *TranscriptionService {
 	}
 }
 
+// staleDownloadMaxAge is how long an untouched partial model download
+// ("<model>.bin.downloading") is kept for resuming before it is removed
+const staleDownloadMaxAge = 7 * 24 * time.Hour
+
 // getModelPath returns the appropriate path for the model file
 func getModelPath(modelName string) string {
 	if modelName == "" {
@@ -513,10 +517,12 @@ func (t *TranscriptionService) downloadModel(modelName string) error {
 	// Get the model URL from the supported models list
 	models := GetSupportedModels()
 	var modelURL string
+	var modelSha1 string
 
 	for _, model := range models {
 		if model.Name == modelName {
 			modelURL = model.Url
+			modelSha1 = model.Sha1
 			break
 		}
 	}
@@ -530,7 +536,7 @@ func (t *TranscriptionService) downloadModel(modelName string) error {
 
 	slog.Info("downloading model", "url", modelURL)
 
-	err := utils.DownloadFile(modelURL, t.modelPath, nil)
+	err := utils.DownloadFile(modelURL, t.modelPath, modelSha1, nil)
 	if err != nil {
 		return fmt.Errorf("failed to download model: %w", err)
 	}
@@ -545,11 +551,13 @@ func (t *TranscriptionService) DownloadModel(ctx context.Context, modelName stri
 	models := GetSupportedModels()
 	var modelURL string
 	var modelFileName string
+	var modelSha1 string
 
 	for _, model := range models {
 		if model.Name == modelName {
 			modelURL = model.Url
 			modelFileName = model.FileName
+			modelSha1 = model.Sha1
 			break
 		}
 	}
@@ -570,6 +578,9 @@ func (t *TranscriptionService) DownloadModel(ctx context.Context, modelName stri
 		return fmt.Errorf("model %s already exists", modelName)
 	}
 
+	// Drop partial downloads of other models that were abandoned long ago
+	utils.RemoveStalePartials(filepath.Dir(modelPath), staleDownloadMaxAge)
+
 	slog.Info("downloading model", "model", modelName, "url", modelURL)
 
 	progressCallback := func(progress float64) {
@@ -583,7 +594,7 @@ func (t *TranscriptionService) DownloadModel(ctx context.Context, modelName stri
 		}
 	}
 
-	err := utils.DownloadFile(modelURL, modelPath, progressCallback)
+	err := utils.DownloadFile(modelURL, modelPath, modelSha1, progressCallback)
 	if err != nil {
 		return fmt.Errorf("failed to download model: %w", err)
 	}
@@ -609,17 +620,24 @@ func (t *TranscriptionService) ListModels() []ModelInfo {
 	t.modelMutex.RUnlock()
 
 	models := GetSupportedModels()
+	modelDirs := make(map[string]bool)
 	for i := range models {
 		// Check if model is downloaded
 		modelPath := getModelPath(models[i].Name)
 		if _, err := os.Stat(modelPath); err == nil {
 			models[i].IsDownloaded = true
 		}
+		modelDirs[filepath.Dir(modelPath)] = true
 
 		// Check if model is currently active
 		models[i].IsActive = models[i].Name == currentModel
 	}
 
+	// Abandoned partial downloads are kept for resuming; clear out old ones
+	for dir := range modelDirs {
+		utils.RemoveStalePartials(dir, staleDownloadMaxAge)
+	}
+
 	return models
 }
 
@@ -4,12 +4,17 @@ import (
 	"archive/tar"
 	"archive/zip"
 	"compress/gzip"
+	"crypto/sha1"
+	"encoding/hex"
 	"fmt"
 	"io"
+	"log/slog"
 	"net/http"
 	"os"
 	"path/filepath"
+	"strconv"
 	"strings"
+	"time"
 )
 
 // ProgressCallback is a function type for reporting download progress (0-100)
@@ -17,31 +22,63 @@ type ProgressCallback func(progress float64)
 
 // DownloadFile downloads a file from the given URL to the specified path.
 // It reports progress via the optional onProgress callback.
-func DownloadFile(url string, destPath string, onProgress ProgressCallback) error {
+// If a previous attempt left a partial download behind, the transfer is
+// resumed from where it stopped using an HTTP Range request. Resuming is
+// only attempted when the server's ETag/Last-Modified validator for the
+// partial file was recorded, and is sent as If-Range so a changed remote
+// file is fetched from scratch instead of being stitched onto stale bytes.
+// If expectedSHA1 is non-empty, the finished file must match it before it is
+// moved to destPath; on mismatch the partial download is discarded.
+//
+// Partial downloads live next to destPath as "<name>.downloading" (plus a
+// "<name>.downloading.etag" validator). See RemoveStalePartials for cleanup.
+func DownloadFile(url string, destPath string, expectedSHA1 string, onProgress ProgressCallback) error {
 	// Ensure directory exists
 	dir := filepath.Dir(destPath)
 	if err := os.MkdirAll(dir, 0755); err != nil {
 		return fmt.Errorf("failed to create directory %s: %w", dir, err)
 	}
 
-	// Use a temp file to avoid leaving partial downloads
+	// Use a temp file to avoid leaving partial downloads at the final path.
+	// The temp file is kept on network errors so the next attempt can resume;
+	// the validator identifying the remote file it belongs to sits next to it.
 	tempPath := destPath + ".downloading"
+	validatorPath := tempPath + ".etag"
 
-	// Create output file
-	out, err := os.Create(tempPath)
+	// Open (or create) the output file without truncating it
+	out, err := os.OpenFile(tempPath, os.O_WRONLY|os.O_CREATE, 0644)
 	if err != nil {
 		return fmt.Errorf("failed to create file %s: %w", tempPath, err)
 	}
 
-	// Cleanup on error
+	// Cleanup on error. Only keep the partial file when it can be safely
+	// resumed later; otherwise discard it along with its validator.
 	success := false
+	discard := false
 	defer func() {
 		out.Close()
-		if !success {
+		if success || discard {
+			os.Remove(validatorPath)
+		}
+		if !success && discard {
 			os.Remove(tempPath)
 		}
 	}()
 
+	// Figure out how much was already downloaded. A partial file without a
+	// recorded validator cannot be matched to the remote file, so start over.
+	var offset int64
+	if info, err := out.Stat(); err == nil {
+		offset = info.Size()
+	}
+	validator := ""
+	if data, err := os.ReadFile(validatorPath); err == nil {
+		validator = strings.TrimSpace(string(data))
+	}
+	if validator == "" {
+		offset = 0
+	}
+
 	// Create HTTP client that follows redirects (Go's default does follow, but let's be explicit)
 	client := &http.Client{
 		CheckRedirect: func(req *http.Request, via []*http.Request) error {
@@ -52,44 +89,128 @@ func DownloadFile(url string, destPath string, onProgress ProgressCallback) erro
 		},
 	}
 
-	// Get response
-	resp, err := client.Get(url)
-	if err != nil {
-		return fmt.Errorf("failed to download from %s: %w", url, err)
+	// Get response. At most one retry: a resume the server cannot honour
+	// consistently falls back to a single full download.
+	var resp *http.Response
+	complete := false
+	for attempt := 0; ; attempt++ {
+		req, err := http.NewRequest(http.MethodGet, url, nil)
+		if err != nil {
+			discard = true
+			return fmt.Errorf("failed to create request for %s: %w", url, err)
+		}
+		if offset > 0 {
+			req.Header.Set("Range", fmt.Sprintf("bytes=%d-", offset))
+			req.Header.Set("If-Range", validator)
+		}
+
+		resp, err = client.Do(req)
+		if err != nil {
+			discard = validator == ""
+			return fmt.Errorf("failed to download from %s: %w", url, err)
+		}
+
+		restart := false
+		switch resp.StatusCode {
+		case http.StatusPartialContent:
+			// Server honoured the range; make sure it starts where we stopped
+			start, _, ok := parseContentRange(resp.Header.Get("Content-Range"))
+			if offset > 0 && ok && start == offset {
+				slog.Info("resuming download", "url", url, "offset", offset)
+			} else {
+				restart = true
+			}
+		case http.StatusOK:
+			// Full body (no partial file, the server ignored the range, or
+			// the remote file changed); start over and record its validator
+			offset = 0
+			validator = responseValidator(resp)
+			if validator != "" {
+				if err := os.WriteFile(validatorPath, []byte(validator), 0644); err != nil {
+					// Without a stored validator the partial cannot be resumed
+					slog.Warn("failed to store download validator", "path", validatorPath, "error", err)
+					validator = ""
+				}
+			} else {
+				os.Remove(validatorPath)
+			}
+		case http.StatusRequestedRangeNotSatisfiable:
+			// The partial file may already hold the whole remote file
+			// (e.g. a previous rename failed)
+			_, size, ok := parseContentRange(resp.Header.Get("Content-Range"))
+			if offset > 0 && ok && size == offset {
+				complete = true
+				if onProgress != nil {
+					onProgress(100)
+				}
+			} else {
+				restart = true
+			}
+		default:
+			resp.Body.Close()
+			discard = true
+			return fmt.Errorf("bad status: %s", resp.Status)
+		}
+
+		if !restart {
+			break
+		}
+		resp.Body.Close()
+		if attempt > 0 {
+			discard = true
+			return fmt.Errorf("bad status: %s", resp.Status)
+		}
+		offset = 0
+		validator = ""
+		os.Remove(validatorPath)
 	}
 	defer resp.Body.Close()
 
-	if resp.StatusCode != http.StatusOK {
-		return fmt.Errorf("bad status: %s", resp.Status)
-	}
+	if !complete {
+		if err := out.Truncate(offset); err != nil {
+			return fmt.Errorf("failed to prepare file %s: %w", tempPath, err)
+		}
+		if _, err := out.Seek(offset, io.SeekStart); err != nil {
+			return fmt.Errorf("failed to prepare file %s: %w", tempPath, err)
+		}
 
-	// Create progress reader
-	contentLength := resp.ContentLength
+		// Create progress reader
+		contentLength := resp.ContentLength
 
-	// If ContentLength is missing (-1), try a HEAD request to get it
-	if contentLength <= 0 {
-		headResp, err := client.Head(url)
-		if err == nil && headResp.StatusCode == http.StatusOK {
-			contentLength = headResp.ContentLength
-			headResp.Body.Close()
+		// If ContentLength is missing (-1), try a HEAD request to get it
+		if contentLength <= 0 && offset == 0 {
+			headResp, err := client.Head(url)
+			if err == nil && headResp.StatusCode == http.StatusOK {
+				contentLength = headResp.ContentLength
+				headResp.Body.Close()
+			}
 		}
-	}
 
-	progressReader := &ProgressReader{
-		Reader:     resp.Body,
-		Total:      contentLength,
-		OnProgress: onProgress,
-	}
+		var total int64 = -1
+		if contentLength > 0 {
+			total = offset + contentLength
+		}
 
-	// Copy to file
-	written, err := io.Copy(out, progressReader)
-	if err != nil {
-		return fmt.Errorf("failed to write file: %w", err)
-	}
+		progressReader := &ProgressReader{
+			Reader:     resp.Body,
+			Total:      total,
+			ReadSoFar:  offset,
+			OnProgress: onProgress,
+		}
 
-	// Verify we got the expected amount of data
-	if contentLength > 0 && written != contentLength {
-		return fmt.Errorf("incomplete download: got %d bytes, expected %d", written, contentLength)
+		// Copy to file. Partial data is only worth keeping if it can be
+		// validated on the next attempt.
+		written, err := io.Copy(out, progressReader)
+		if err != nil {
+			discard = validator == ""
+			return fmt.Errorf("failed to write file: %w", err)
+		}
+
+		// Verify we got the expected amount of data
+		if contentLength > 0 && written != contentLength {
+			discard = validator == ""
+			return fmt.Errorf("incomplete download: got %d bytes, expected %d", offset+written, total)
+		}
 	}
 
 	// Ensure data is flushed to disk
@@ -98,6 +219,18 @@ func DownloadFile(url string, destPath string, onProgress ProgressCallback) erro
 	}
 	out.Close()
 
+	// Verify the checksum over the whole file, including any resumed prefix
+	if expectedSHA1 != "" {
+		sum, err := fileSHA1(tempPath)
+		if err != nil {
+			return fmt.Errorf("failed to hash file %s: %w", tempPath, err)
+		}
+		if !strings.EqualFold(sum, expectedSHA1) {
+			discard = true
+			return fmt.Errorf("checksum mismatch: got sha1 %s, expected %s", sum, expectedSHA1)
+		}
+	}
+
 	// Move temp file to final destination
 	if err := os.Rename(tempPath, destPath); err != nil {
 		return fmt.Errorf("failed to rename temp file: %w", err)
@@ -107,6 +240,105 @@ func DownloadFile(url string, destPath string, onProgress ProgressCallback) erro
 	return nil
 }
 
+// fileSHA1 returns the hex-encoded SHA-1 digest of the file at path.
+func fileSHA1(path string) (string, error) {
+	f, err := os.Open(path)
+	if err != nil {
+		return "", err
+	}
+	defer f.Close()
+
+	h := sha1.New()
+	if _, err := io.Copy(h, f); err != nil {
+		return "", err
+	}
+	return hex.EncodeToString(h.Sum(nil)), nil
+}
+
+// RemoveStalePartials deletes partial downloads left in dir by DownloadFile
+// ("*.downloading" files and their ".downloading.etag" validators) that have
+// not been written to for longer than maxAge. Recent partials are kept so an
+// interrupted download can still be resumed.
+func RemoveStalePartials(dir string, maxAge time.Duration) {
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		return
+	}
+
+	cutoff := time.Now().Add(-maxAge)
+	for _, entry := range entries {
+		name := entry.Name()
+		if entry.IsDir() {
+			continue
+		}
+		if partial, found := strings.CutSuffix(name, ".downloading.etag"); found {
+			// Validator whose partial download is already gone
+			if _, err := os.Stat(filepath.Join(dir, partial+".downloading")); os.IsNotExist(err) {
+				os.Remove(filepath.Join(dir, name))
+			}
+			continue
+		}
+		if !strings.HasSuffix(name, ".downloading") {
+			continue
+		}
+		info, err := entry.Info()
+		if err != nil || info.ModTime().After(cutoff) {
+			continue
+		}
+
+		path := filepath.Join(dir, name)
+		slog.Info("removing stale partial download", "path", path, "size", info.Size())
+		os.Remove(path)
+		os.Remove(path + ".etag")
+	}
+}
+
+// responseValidator returns the value to send as If-Range when resuming a
+// download of this response: a strong ETag, or Last-Modified otherwise.
+// Weak ETags are not allowed in If-Range, so they are skipped.
+func responseValidator(resp *http.Response) string {
+	if etag := resp.Header.Get("ETag"); etag != "" && !strings.HasPrefix(etag, "W/") {
+		return etag
+	}
+	return resp.Header.Get("Last-Modified")
+}
+
+// parseContentRange parses a Content-Range header of the form
+// "bytes start-end/size" or "bytes */size". It returns the start offset
+// (-1 for the unsatisfied form) and the complete size (-1 if unknown).
+func parseContentRange(header string) (start int64, size int64, ok bool) {
+	spec, found := strings.CutPrefix(header, "bytes ")
+	if !found {
+		return 0, 0, false
+	}
+	rangePart, sizePart, found := strings.Cut(spec, "/")
+	if !found {
+		return 0, 0, false
+	}
+
+	size = -1
+	if sizePart != "*" {
+		n, err := strconv.ParseInt(sizePart, 10, 64)
+		if err != nil {
+			return 0, 0, false
+		}
+		size = n
+	}
+
+	if rangePart == "*" {
+		return -1, size, true
+	}
+	startPart, _, found := strings.Cut(rangePart, "-")
+	if !found {
+		return 0, 0, false
+	}
+	start, err := strconv.ParseInt(startPart, 10, 64)
+	if err != nil {
+		return 0, 0, false
+	}
+	return start, size, true
+}
+
 // ProgressReader wraps an io.Reader to track download progress
 type ProgressReader struct {
 	Reader     io.Reader
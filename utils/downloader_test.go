@@ -0,0 +1,325 @@
+package utils
+
+import (
+	"bytes"
+	"crypto/sha1"
+	"encoding/hex"
+	"net/http"
+	"net/http/httptest"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+)
+
+var testModified = time.Date(2024, 1, 2, 3, 4, 5, 0, time.UTC)
+
+// testPayload returns deterministic content for the mock model file
+func testPayload() []byte {
+	data := make([]byte, 10000)
+	for i := range data {
+		data[i] = byte(i * 7)
+	}
+	return data
+}
+
+func testSHA1(data []byte) string {
+	sum := sha1.Sum(data)
+	return hex.EncodeToString(sum[:])
+}
+
+// newTestServer serves data with range support via http.ServeContent.
+// It records the Range header of every request in ranges.
+func newTestServer(t *testing.T, data []byte, etag string, ranges *[]string) *httptest.Server {
+	t.Helper()
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Method == http.MethodGet && ranges != nil {
+			*ranges = append(*ranges, r.Header.Get("Range"))
+		}
+		if etag != "" {
+			w.Header().Set("ETag", etag)
+		}
+		http.ServeContent(w, r, "model.bin", testModified, bytes.NewReader(data))
+	}))
+	t.Cleanup(srv.Close)
+	return srv
+}
+
+// writePartial leaves a partial download (and optional validator) behind
+func writePartial(t *testing.T, destPath string, data []byte, validator string) {
+	t.Helper()
+	if err := os.WriteFile(destPath+".downloading", data, 0644); err != nil {
+		t.Fatal(err)
+	}
+	if validator != "" {
+		if err := os.WriteFile(destPath+".downloading.etag", []byte(validator), 0644); err != nil {
+			t.Fatal(err)
+		}
+	}
+}
+
+// assertDownloaded checks destPath holds want and no partial files remain
+func assertDownloaded(t *testing.T, destPath string, want []byte) {
+	t.Helper()
+	got, err := os.ReadFile(destPath)
+	if err != nil {
+		t.Fatalf("reading %s: %v", destPath, err)
+	}
+	if !bytes.Equal(got, want) {
+		t.Fatalf("downloaded content mismatch: got %d bytes, want %d", len(got), len(want))
+	}
+	for _, path := range []string{destPath + ".downloading", destPath + ".downloading.etag"} {
+		if _, err := os.Stat(path); err == nil {
+			t.Errorf("%s left behind after successful download", path)
+		}
+	}
+}
+
+func TestDownloadFileFresh(t *testing.T) {
+	data := testPayload()
+	var ranges []string
+	srv := newTestServer(t, data, `"v1"`, &ranges)
+	destPath := filepath.Join(t.TempDir(), "model.bin")
+
+	var last float64
+	if err := DownloadFile(srv.URL, destPath, testSHA1(data), func(p float64) { last = p }); err != nil {
+		t.Fatal(err)
+	}
+	assertDownloaded(t, destPath, data)
+	if len(ranges) != 1 || ranges[0] != "" {
+		t.Errorf("expected a single full request, got ranges %q", ranges)
+	}
+	if last != 100 {
+		t.Errorf("final progress = %v, want 100", last)
+	}
+}
+
+func TestDownloadFileResumesAfterInterruption(t *testing.T) {
+	data := testPayload()
+	destPath := filepath.Join(t.TempDir(), "model.bin")
+
+	// First attempt: the server drops the connection part way through
+	cut := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("ETag", `"v1"`)
+		w.Header().Set("Content-Length", "10000")
+		w.Write(data[:4000])
+	}))
+	defer cut.Close()
+	if err := DownloadFile(cut.URL, destPath, "", nil); err == nil {
+		t.Fatal("expected an error for a truncated transfer")
+	}
+	if info, err := os.Stat(destPath + ".downloading"); err != nil || info.Size() != 4000 {
+		t.Fatalf("partial download not kept for resuming: %v", err)
+	}
+	if _, err := os.Stat(destPath); err == nil {
+		t.Fatal("truncated download was moved to the final path")
+	}
+
+	// Second attempt resumes from the kept bytes
+	var ranges []string
+	srv := newTestServer(t, data, `"v1"`, &ranges)
+	if err := DownloadFile(srv.URL, destPath, testSHA1(data), nil); err != nil {
+		t.Fatal(err)
+	}
+	assertDownloaded(t, destPath, data)
+	if len(ranges) != 1 || ranges[0] != "bytes=4000-" {
+		t.Errorf("expected a single resumed request, got ranges %q", ranges)
+	}
+}
+
+func TestDownloadFileResumesWithLastModified(t *testing.T) {
+	data := testPayload()
+	var ranges []string
+	srv := newTestServer(t, data, "", &ranges)
+	destPath := filepath.Join(t.TempDir(), "model.bin")
+	writePartial(t, destPath, data[:5000], testModified.Format(http.TimeFormat))
+
+	if err := DownloadFile(srv.URL, destPath, testSHA1(data), nil); err != nil {
+		t.Fatal(err)
+	}
+	assertDownloaded(t, destPath, data)
+	if len(ranges) != 1 || ranges[0] != "bytes=5000-" {
+		t.Errorf("expected a single resumed request, got ranges %q", ranges)
+	}
+}
+
+func TestDownloadFileRefetchesWhenETagChanged(t *testing.T) {
+	data := testPayload()
+	srv := newTestServer(t, data, `"v2"`, nil)
+	destPath := filepath.Join(t.TempDir(), "model.bin")
+	writePartial(t, destPath, bytes.Repeat([]byte{0xAA}, 3333), `"v1"`)
+
+	if err := DownloadFile(srv.URL, destPath, testSHA1(data), nil); err != nil {
+		t.Fatal(err)
+	}
+	assertDownloaded(t, destPath, data)
+}
+
+func TestDownloadFileRestartsWithoutValidator(t *testing.T) {
+	data := testPayload()
+	var ranges []string
+	srv := newTestServer(t, data, `"v1"`, &ranges)
+	destPath := filepath.Join(t.TempDir(), "model.bin")
+	writePartial(t, destPath, bytes.Repeat([]byte{0xAA}, 3333), "")
+
+	if err := DownloadFile(srv.URL, destPath, "", nil); err != nil {
+		t.Fatal(err)
+	}
+	assertDownloaded(t, destPath, data)
+	if len(ranges) != 1 || ranges[0] != "" {
+		t.Errorf("partial without validator should not be resumed, got ranges %q", ranges)
+	}
+}
+
+func TestDownloadFileAlreadyCompletePartial(t *testing.T) {
+	data := testPayload()
+	var ranges []string
+	srv := newTestServer(t, data, `"v1"`, &ranges)
+	destPath := filepath.Join(t.TempDir(), "model.bin")
+	writePartial(t, destPath, data, `"v1"`)
+
+	var last float64
+	if err := DownloadFile(srv.URL, destPath, testSHA1(data), func(p float64) { last = p }); err != nil {
+		t.Fatal(err)
+	}
+	assertDownloaded(t, destPath, data)
+	if len(ranges) != 1 {
+		t.Errorf("expected the 416 to complete without a refetch, got ranges %q", ranges)
+	}
+	if last != 100 {
+		t.Errorf("final progress = %v, want 100", last)
+	}
+}
+
+func TestDownloadFileOversizedPartial(t *testing.T) {
+	data := testPayload()
+	srv := newTestServer(t, data, `"v1"`, nil)
+	destPath := filepath.Join(t.TempDir(), "model.bin")
+	writePartial(t, destPath, make([]byte, 20000), `"v1"`)
+
+	if err := DownloadFile(srv.URL, destPath, "", nil); err != nil {
+		t.Fatal(err)
+	}
+	assertDownloaded(t, destPath, data)
+}
+
+func TestDownloadFileMismatchedContentRangeStart(t *testing.T) {
+	data := testPayload()
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("ETag", `"v1"`)
+		if r.Header.Get("Range") != "" {
+			// Claims partial content but sends the file from the start
+			w.Header().Set("Content-Range", "bytes 0-9999/10000")
+			w.WriteHeader(http.StatusPartialContent)
+		}
+		w.Write(data)
+	}))
+	defer srv.Close()
+	destPath := filepath.Join(t.TempDir(), "model.bin")
+	writePartial(t, destPath, data[:3333], `"v1"`)
+
+	if err := DownloadFile(srv.URL, destPath, testSHA1(data), nil); err != nil {
+		t.Fatal(err)
+	}
+	assertDownloaded(t, destPath, data)
+}
+
+func TestDownloadFileChecksumMismatch(t *testing.T) {
+	data := testPayload()
+	srv := newTestServer(t, data, `"v1"`, nil)
+	destPath := filepath.Join(t.TempDir(), "model.bin")
+
+	// A corrupt prefix that the server still accepts for resuming
+	corrupt := append([]byte(nil), data[:5000]...)
+	corrupt[10] ^= 0xFF
+	writePartial(t, destPath, corrupt, `"v1"`)
+
+	if err := DownloadFile(srv.URL, destPath, testSHA1(data), nil); err == nil {
+		t.Fatal("expected a checksum mismatch error")
+	}
+	for _, path := range []string{destPath, destPath + ".downloading", destPath + ".downloading.etag"} {
+		if _, err := os.Stat(path); err == nil {
+			t.Errorf("%s should not exist after a checksum mismatch", path)
+		}
+	}
+
+	// The next attempt starts from scratch and succeeds
+	if err := DownloadFile(srv.URL, destPath, testSHA1(data), nil); err != nil {
+		t.Fatal(err)
+	}
+	assertDownloaded(t, destPath, data)
+}
+
+func TestDownloadFileDiscardsUnresumableShortRead(t *testing.T) {
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Header().Set("Content-Length", "10000")
+		w.Write(testPayload()[:4000])
+	}))
+	defer srv.Close()
+	destPath := filepath.Join(t.TempDir(), "model.bin")
+
+	if err := DownloadFile(srv.URL, destPath, "", nil); err == nil {
+		t.Fatal("expected an error for a truncated transfer")
+	}
+	if _, err := os.Stat(destPath + ".downloading"); err == nil {
+		t.Error("partial without a validator should be discarded")
+	}
+}
+
+func TestRemoveStalePartials(t *testing.T) {
+	dir := t.TempDir()
+	write := func(name string, age time.Duration) string {
+		path := filepath.Join(dir, name)
+		if err := os.WriteFile(path, []byte("x"), 0644); err != nil {
+			t.Fatal(err)
+		}
+		mtime := time.Now().Add(-age)
+		if err := os.Chtimes(path, mtime, mtime); err != nil {
+			t.Fatal(err)
+		}
+		return path
+	}
+
+	stale := write("ggml-large-v3.bin.downloading", 48*time.Hour)
+	staleETag := write("ggml-large-v3.bin.downloading.etag", 48*time.Hour)
+	fresh := write("ggml-base.bin.downloading", time.Minute)
+	freshETag := write("ggml-base.bin.downloading.etag", 48*time.Hour)
+	orphanETag := write("ggml-tiny.bin.downloading.etag", time.Minute)
+	model := write("ggml-small.bin", 48*time.Hour)
+
+	RemoveStalePartials(dir, 24*time.Hour)
+
+	for _, path := range []string{stale, staleETag, orphanETag} {
+		if _, err := os.Stat(path); err == nil {
+			t.Errorf("%s should have been removed", filepath.Base(path))
+		}
+	}
+	for _, path := range []string{fresh, freshETag, model} {
+		if _, err := os.Stat(path); err != nil {
+			t.Errorf("%s should have been kept: %v", filepath.Base(path), err)
+		}
+	}
+}
+
+func TestParseContentRange(t *testing.T) {
+	tests := []struct {
+		header string
+		start  int64
+		size   int64
+		ok     bool
+	}{
+		{"bytes 100-199/200", 100, 200, true},
+		{"bytes */200", -1, 200, true},
+		{"bytes 0-9/*", 0, -1, true},
+		{"", 0, 0, false},
+		{"bytes x-9/10", 0, 0, false},
+		{"items 0-9/10", 0, 0, false},
+	}
+	for _, tt := range tests {
+		start, size, ok := parseContentRange(tt.header)
+		if start != tt.start || size != tt.size || ok != tt.ok {
+			t.Errorf("parseContentRange(%q) = %d, %d, %v; want %d, %d, %v",
+				tt.header, start, size, ok, tt.start, tt.size, tt.ok)
+		}
+	}
+}